@@ -1,8 +1,19 @@
 OUTPUT_CSV = "OUTPUT.csv"
+COORDS_CACHE = ".city_coords_cache.json"  # Geocoded city centers reused across runs (None = off)
+CSV_BUFFER_BYTES = 1 << 20      # Output file buffer; flushed at every city boundary
 HEADLESS = True                 # Set False to watch it run
-RATE_LIMIT_SEC = 0.8
+BLOCK_RESOURCES = True          # Abort image/font/media and ad/analytics requests
+CITY_CONCURRENCY = 3            # Pooled contexts, i.e. cities in parallel (1 = cleanest live table)
+POOL_SIZE = 4                   # Tabs per context for fetching place details in parallel
+RATE_LIMIT_SEC = 0.8            # Settle time on each place page before reading it
+NAV_PER_SEC = 2.0               # Place-page visits started per second, all cities/tabs combined (0 = no cap)
 MAX_PER_CITY = 400              # Safety cap per city
+DETAIL_PAGES = True             # False = feed-card fields only (no address/socials; no per-place visits)
 MAX_IDLE_ROUNDS = 6             # Stop scrolling if nothing new after these rounds
+ADAPTIVE_IDLE = True            # Also stop early once results plateau (see below)
+ADAPTIVE_IDLE_ALPHA = 0.3       # ...i.e. an EWMA (this weight on the latest round) of rounds that found something new
+ADAPTIVE_IDLE_FLOOR = 0.5       # ...stays below this
+ADAPTIVE_IDLE_ROUNDS = 3        # ...for this many rounds in a row (4 idle rounds after a productive run)
 DEBUG_SHOTS = False             # Save debug screenshots
 
 # =======================
@@ -10,6 +21,6 @@ DEBUG_SHOTS = False             # Save debug screenshots
 # =======================
 SHOW_TERMINAL_PREVIEW = True
 TERMINAL_PREVIEW_MAX = 40
-TERMINAL_COLUMNS = ["name", "rating", "phone", "website", "lat", "lon"]
+TERMINAL_COLUMNS = ("name", "rating", "phone", "website", "lat", "lon")
 COL_WIDTHS = {"name": 38, "rating": 6, "phone": 18, "website": 30, "lat": 10, "lon": 11}
 DEFAULT_ZOOM = 12  # city-level
\ No newline at end of file
@@ -9,15 +9,29 @@ This module centralizes all region-specific knobs and parameters:
 - Region-aware UI helpers and parsing helpers
 
 Exports used by scraper.py:
-CITIES, CITY_CENTER_LOOKUP, KEYWORDS, SEARCH_THIS_AREA_TEXTS, COOKIE_ACCEPT_TEXTS,
-REVIEW_WORDS, STAR_WORDS,
-dismiss_signin_or_promos(), click_next_page_if_present(),
-_parse_rating_from_string(), _review_word_pattern(), _parse_reviews_from_string()
+CITIES, CITY_CENTER_LOOKUP, KEYWORDS, KEYWORDS_DEDUP, EXACT_BOOLEAN_QUERY, SEARCH_THIS_AREA_TEXTS, COOKIE_ACCEPT_TEXTS,
+REVIEW_WORDS, STAR_WORDS, STAR_WORD_LITERAL_RE,
+dismiss_signin_or_promos(), click_next_page_if_present(), click_first_button(),
+_parse_rating_from_string(), _review_word_pattern(), _parse_reviews_from_string(), _nfc()
 """
 
 from __future__ import annotations
 import re
+import sys
 import unicodedata
+from contextlib import suppress
+from functools import lru_cache
+
+from playwright.async_api import Error as PlaywrightError
+
+# =========================================================
+# Unicode normalization (applied once to the string tables below)
+# =========================================================
+def _nfc(s: str) -> str:
+    """NFC-compose `s`; returns it unchanged (no copy) when already composed."""
+    if not s or unicodedata.is_normalized("NFC", s):
+        return s
+    return unicodedata.normalize("NFC", s)
 
 # =========================================================
 # Cities along with their Countries and the city centers.
@@ -50,8 +64,9 @@ CITIES_DATA = [
 ]
 
 # Back-compat derived exports
-CITIES = [c["name"] for c in CITIES_DATA]
-CITY_CENTER_LOOKUP = {c["name"].lower(): (c["lat"], c["lon"]) for c in CITIES_DATA}
+CITIES = tuple(c["name"] for c in CITIES_DATA)
+# Keys are pre-normalized (strip + casefold) so lookups do a single dict hit
+CITY_CENTER_LOOKUP = {c["name"].strip().casefold(): (c["lat"], c["lon"]) for c in CITIES_DATA}
 
 # =========================================================
 # KEYWORDS for cafés (EN + DE + FR + IT + ES); deduped & expanded
@@ -105,6 +120,25 @@ KEYWORDS = [
     "saló de bellesa", "centre d'estètica", "estètica",
     "saló d'ungles", "manicura", "pedicura", "spa",
 ]
+KEYWORDS = tuple(_nfc(k) for k in KEYWORDS)
+
+def _fold_keyword(k: str) -> str:
+    """Case- and accent-insensitive key: 'Barbería' and 'barberia' fold to the same string."""
+    decomposed = unicodedata.normalize("NFKD", k.strip())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+def _dedupe_keywords(words) -> tuple[str, ...]:
+    """Drop repeats and accent/case variants, keeping the first spelling in order."""
+    seen: dict[str, str] = {}
+    for w in words:
+        seen.setdefault(_fold_keyword(w), w)
+    return tuple(seen.values())
+
+# Maps matching is already accent- and case-insensitive, so variants add nothing
+KEYWORDS_DEDUP = _dedupe_keywords(KEYWORDS)
+
+# One boolean search string per city, built once from the deduped keywords
+EXACT_BOOLEAN_QUERY = " OR ".join(f"\"{t}\"" for t in KEYWORDS_DEDUP)
 
 # =========================================================
 # UI strings (cookies, "Search this area")
@@ -141,6 +175,10 @@ COOKIE_ACCEPT_TEXTS = [
     "Acceptar tot", "D’acord", "D'acord",
 ]
 
+# Compose accents once so matches against (NFC) page text never miss on é vs e + U+0301
+SEARCH_THIS_AREA_TEXTS = tuple(_nfc(t) for t in SEARCH_THIS_AREA_TEXTS)
+COOKIE_ACCEPT_TEXTS = tuple(_nfc(t) for t in COOKIE_ACCEPT_TEXTS)
+
 # =========================================================
 # Locale vocabulary for parsing ratings & reviews
 # =========================================================
@@ -169,19 +207,22 @@ STAR_WORDS = (
     # Spanish / Catalan
     "estrella", "estrellas",
 )
+REVIEW_WORDS = tuple(_nfc(w) for w in REVIEW_WORDS)
+STAR_WORDS = tuple(_nfc(w) for w in STAR_WORDS)
 
-# Map compact count units to multipliers
+# Map compact count units to multipliers (keys lowercase, no trailing ".";
+# lookups normalize the matched unit the same way)
 COUNT_UNITS = {
     # English
-    "k": 1_000, "K": 1_000,
-    "m": 1_000_000, "M": 1_000_000,
+    "k": 1_000,
+    "m": 1_000_000,
 
     # German (spelled/abbr)
-    "tausend": 1_000, "Tausend": 1_000, "Tsd.": 1_000, "Tsd": 1_000,
-    "Million": 1_000_000, "Millionen": 1_000_000, "Mio.": 1_000_000, "Mio": 1_000_000,
+    "tausend": 1_000, "tsd": 1_000,
+    "million": 1_000_000, "millionen": 1_000_000, "mio": 1_000_000,
 
     # French
-    "million": 1_000_000, "millions": 1_000_000,
+    "millions": 1_000_000,
 
     # Italian
     "mille": 1_000, "mila": 1_000,
@@ -198,7 +239,7 @@ COUNT_UNITS = {
 # =========================================================
 
 # Star words (as a single alternation) for rating parser
-_STAR_WORDS_ALT = r"(?:stars?|stern(?:e)?|étoiles?|stella(?:e)?|estrellas?)"
+_STAR_WORDS_ALT = r"(?:stars?|sterne?|étoiles?|stell[ae]|estrellas?)"
 
 # Review words alternation (used by multiple parsers)
 _REVIEW_WORDS_ALT = (
@@ -211,169 +252,250 @@ _REVIEW_WORDS_ALT = (
     r")"
 )
 
-# Compact/spelled unit alternation
+# Compact/spelled unit alternation (compiled with IGNORECASE, so lowercase only).
+# Branches are ordered longest-first so the first branch that matches is also the
+# right one ("mila" is never read as "m" + "ila"), and the unit must end at a word
+# boundary so "5 min" is not a count.
 _UNITS_ALT = (
-    r"(?:K|k|M|m"
-    r"|tausend|Tausend|Tsd\.?|Million(?:en)?|Mio\.?"
-    r"|million|millions"
-    r"|mille|mila|milione|milioni"
-    r"|mil|millón|millones|milió|milions"
-    r")"
+    r"(?:millionen|millones|millions|tausend"
+    r"|milione|milioni|milions"
+    r"|million|millón|mille|milió"
+    r"|mila|mil|tsd\.?|mio\.?"
+    r"|k|m"
+    r")(?![^\W\d_])"
 )
 
 # Compiled patterns
+ANY_DIGIT_RE = re.compile(r"[0-9]")   # cheap pretest on ASCII-normalized strings
+NON_DIGIT_RE = re.compile(r"[^0-9]")
+STAR_FALLBACK_RE = re.compile(r"([0-5](?:[.,]\d)?)")   # first 0–5 floatish number
 RATING_RE = re.compile(
     rf"([0-5](?:[.,]\d)?)\s*(?:/|[\s])?\s*5?(?:\s*{_STAR_WORDS_ALT})?",
     re.IGNORECASE,
 )
-COMPACT_NUM_UNIT_RE = re.compile(
-    rf"(\d+(?:[.,]\d+)?)\s*{_UNITS_ALT}",
+# Compact "1.2K" is searched on its own: in the shared scan below, `big` would
+# swallow its digits whenever a rating precedes it ("4.5 1.2K reviews").
+COMPACT_COUNT_RE = re.compile(
+    rf"(?P<compact>\d+(?:[.,]\d+)?)\s*(?P<unit>{_UNITS_ALT})",
     re.IGNORECASE,
 )
-EXPLICIT_NUM_REV_RE = re.compile(
-    rf"([\d\s.,]+)\s*{_REVIEW_WORDS_ALT}",
+# The other review-count shapes in one alternation, scanned with a single finditer:
+#   explicit "1,234 reviews" | paren "(1,234)" | big "1 234"
+REVIEW_COUNT_RE = re.compile(
+    rf"(?P<explicit>[\d\s.,]+)\s*{_REVIEW_WORDS_ALT}"
+    r"|\((?P<paren>[\d\s.,]+)\)"
+    r"|(?P<big>\d[\d\s.,]{2,})",
     re.IGNORECASE,
 )
-PAREN_NUM_RE = re.compile(r"\(([\d\s.,]+)\)")
-BIG_NUM_RE = re.compile(r"(\d[\d\s.,]{2,})")
+# Any review/star word as a substring (same semantics as `w in s.lower()` over the tuples),
+# matched in a single scan instead of one `in` test per word. Case-sensitive on purpose:
+# search them against the one casefolded copy each parser makes.
+REVIEW_WORD_RE = re.compile("|".join(re.escape(w.casefold()) for w in REVIEW_WORDS))
+STAR_WORD_RE = re.compile("|".join(re.escape(w.casefold()) for w in STAR_WORDS))
+# As-written (case-sensitive) star words, for the visible-text pretest in scraper.py
+STAR_WORD_LITERAL_RE = re.compile("|".join(re.escape(w) for w in STAR_WORDS))
 
 # =========================================================
 # Shared low-level helpers (digits & numbers)
 # =========================================================
+# Every Unicode decimal digit ("Nd") → its ASCII ordinal, built once for str.translate
+_DIGIT_TABLE = {
+    cp: ord("0") + unicodedata.decimal(chr(cp))
+    for cp in range(sys.maxunicode + 1)
+    if cp > 0x7F and unicodedata.category(chr(cp)) == "Nd"
+}
+# Arabic decimal/thousands separators ride along in the same pass, so '٤٫٥' reads
+# as 4.5 (not 4) and '١٬٢٣٤' as 1,234 (not 234)
+_DIGIT_TABLE[0x066B] = ord(".")
+_DIGIT_TABLE[0x066C] = ord(",")
+
 def _to_ascii_digits(s: str) -> str:
-    """Convert Unicode digits (Arabic-Indic etc.) to ASCII 0-9."""
-    out = []
-    for ch in s or "":
-        try:
-            if unicodedata.category(ch) == "Nd":
-                out.append(str(unicodedata.digit(ch)))
-            else:
-                out.append(ch)
-        except Exception:
-            out.append(ch)
-    return "".join(out)
+    """Convert Unicode digits (Arabic-Indic etc.) and Arabic separators to ASCII."""
+    return s.translate(_DIGIT_TABLE) if s else ""
+
+# _parse_compact_count's number in one pass: Unicode digits → ASCII, and both
+# decimal commas and Arabic separators → '.'
+_DECIMAL_TABLE = {**_DIGIT_TABLE, ord(","): ord("."), 0x066B: ord("."), 0x066C: ord(".")}
+
+@lru_cache(maxsize=256)
+def _unit_multiplier(unit: str) -> int | None:
+    """COUNT_UNITS value for a matched unit ('K', 'Mio.', ' mila'); the handful of
+    spellings COMPACT_COUNT_RE can capture are normalized once, then cached."""
+    return COUNT_UNITS.get(unit.strip().lower().rstrip("."))
 
 def _parse_compact_count(num: str, unit: str) -> int | None:
     """Parse compact/spelled counts like '1.2K' / '1,2 Mio.' / '2 mila' / '1 millón' → int."""
     if not num or not unit:
         return None
-    mult = COUNT_UNITS.get(unit.strip())
+    mult = _unit_multiplier(unit)
     if not mult:
         return None
-    num_norm = _to_ascii_digits(num).replace(",", ".")
+    num_norm = num.translate(_DECIMAL_TABLE)
     try:
+        if "." not in num_norm:
+            return int(num_norm) * mult  # '2K' / '3 mila': exact integer math, no float round-trip
         return int(round(float(num_norm) * mult))
     except Exception:
         return None
 
+# Delete table for _parse_plain_int: every ASCII non-digit plus the Unicode spaces
+# (NBSP, narrow NBSP, ...) that `\s` lets into the captured number groups
+_NONDIGIT_DEL = str.maketrans("", "", "".join(
+    [chr(c) for c in range(0x80) if not chr(c).isdigit()]
+    + [chr(c) for c in range(0x80, 0x3001) if chr(c).isspace()]
+))
+# _parse_plain_int's whole cleanup in one pass: Unicode digits → ASCII, every
+# separator (including the Arabic ones) deleted
+_COUNT_TABLE = {**_DIGIT_TABLE, **_NONDIGIT_DEL, 0x066B: None, 0x066C: None}
+
 def _parse_plain_int(num: str) -> int | None:
     """Parse '1,234' / '1.234' / '1 234' → int."""
     if not num:
         return None
-    cleaned = re.sub(r"[^\d]", "", _to_ascii_digits(num))
+    cleaned = num.translate(_COUNT_TABLE)
+    if not (cleaned.isascii() and cleaned.isdigit()):
+        # Rare leftovers (other non-ASCII separators): strip the slow way
+        cleaned = NON_DIGIT_RE.sub("", cleaned)
     return int(cleaned) if cleaned else None
 
 # =========================================================
 # Region-aware UI helpers
 # =========================================================
-DISMISS_BUTTON_SELECTORS = [
+DISMISS_BUTTON_TEXTS = [
     # English
-    'button:has-text("No thanks")',
-    'button:has-text("Not now")',
-    'button:has-text("Skip")',
-    'button:has-text("Close")',
-    'button:has-text("Dismiss")',
+    "No thanks",
+    "Not now",
+    "Skip",
+    "Close",
+    "Dismiss",
 
     # German
-    'button:has-text("Nein danke")',
-    'button:has-text("Nicht jetzt")',
-    'button:has-text("Später")',
-    'button:has-text("Überspringen")',
-    'button:has-text("Schließen")',
-    'button:has-text("Ablehnen")',
+    "Nein danke",
+    "Nicht jetzt",
+    "Später",
+    "Überspringen",
+    "Schließen",
+    "Ablehnen",
 
     # French
-    'button:has-text("Non merci")',
-    'button:has-text("Pas maintenant")',
-    'button:has-text("Plus tard")',
-    'button:has-text("Ignorer")',
-    'button:has-text("Fermer")',
-    'button:has-text("Refuser")',
+    "Non merci",
+    "Pas maintenant",
+    "Plus tard",
+    "Ignorer",
+    "Fermer",
+    "Refuser",
 
     # Italian
-    'button:has-text("No grazie")',
-    'button:has-text("Non ora")',
-    'button:has-text("Più tardi")',
-    'button:has-text("Ignora")',
-    'button:has-text("Chiudi")',
-    'button:has-text("Rifiuta")',
+    "No grazie",
+    "Non ora",
+    "Più tardi",
+    "Ignora",
+    "Chiudi",
+    "Rifiuta",
 
     # Spanish / Catalan
-    'button:has-text("No, gracias")',
-    'button:has-text("Ahora no")',
-    'button:has-text("Más tarde")',
-    'button:has-text("Omitir")',
-    'button:has-text("Cerrar")',
-    'button:has-text("Rechazar")',
-    'button:has-text("Ara no")',
-    'button:has-text("Més tard")',
-    'button:has-text("Tanca")',
+    "No, gracias",
+    "Ahora no",
+    "Más tarde",
+    "Omitir",
+    "Cerrar",
+    "Rechazar",
+    "Ara no",
+    "Més tard",
+    "Tanca",
+]
+
+# "Next page" buttons: matched by aria-label fragment or by visible text (has-text semantics)
+NEXT_BUTTON_ARIA = [
+    # English
+    "Next",
 ]
 
-NEXT_BUTTON_SELECTORS = [
+NEXT_BUTTON_TEXTS = [
     # English
-    'button[aria-label*="Next"]',
-    'button:has-text("Next")',
+    "Next",
     # German
-    'button:has-text("Weiter")',
-    'button:has-text("Nächste")',
-    'button:has-text("Nächste Seite")',
+    "Weiter", "Nächste", "Nächste Seite",
     # French
-    'button:has-text("Suivant")',
-    'button:has-text("Suivante")',
-    'button:has-text("Page suivante")',
+    "Suivant", "Suivante", "Page suivante",
     # Italian
-    'button:has-text("Avanti")',
-    'button:has-text("Successivo")',
-    'button:has-text("Pagina successiva")',
+    "Avanti", "Successivo", "Pagina successiva",
     # Spanish / Catalan
-    'button:has-text("Siguiente")',
-    'button:has-text("Página siguiente")',
-    'button:has-text("Següent")',
+    "Siguiente", "Página siguiente", "Següent",
 ]
-
-def dismiss_signin_or_promos(page) -> None:
-    for sel in DISMISS_BUTTON_SELECTORS:
-        try:
-            btn = page.locator(sel).first
-            if btn.count() > 0:
-                btn.click(timeout=1200)
-        except Exception:
-            pass
-
-def click_next_page_if_present(page) -> bool:
-    for sel in NEXT_BUTTON_SELECTORS:
-        try:
-            el = page.locator(sel).first
-            if el.count() > 0:
-                el.click(timeout=1200)
-                try:
-                    page.wait_for_selector('[role="progressbar"]', timeout=3000, state="detached")
-                except Exception:
-                    pass
-                return True
-        except Exception:
-            pass
-    return False
+NEXT_BUTTON_ARIA = tuple(_nfc(t) for t in NEXT_BUTTON_ARIA)
+NEXT_BUTTON_TEXTS = tuple(_nfc(t) for t in NEXT_BUTTON_TEXTS)
+
+DISMISS_BUTTON_TEXTS = tuple(_nfc(t) for t in DISMISS_BUTTON_TEXTS)
+
+# Tries the candidates in list order, like the old one-selector-per-locator loops:
+# for each [isAria, needle], the first visible enabled button (in document order)
+# whose aria-label / text contains it is clicked (case-insensitive,
+# whitespace-collapsed, like Playwright's :has-text). Page text is NFC-composed
+# to match the tables.
+_CLICK_FIRST_BUTTON_JS = """(cands) => {
+    const norm = s => (s || "").normalize("NFC").replace(/\\s+/g, " ").trim().toLowerCase();
+    const buttons = [];
+    for (const b of document.querySelectorAll("button")) {
+        if (b.disabled || b.getClientRects().length === 0) continue;
+        buttons.push([b, norm(b.getAttribute("aria-label")), norm(b.textContent)]);
+    }
+    if (!buttons.length) return false;
+    for (const [isAria, needle] of cands) {
+        const n = norm(needle);
+        for (const [b, label, text] of buttons) {
+            if ((isAria ? label : text).includes(n)) {
+                b.click();
+                return true;
+            }
+        }
+    }
+    return false;
+}"""
+
+async def click_first_button(page, texts, aria=(), aria_first=False) -> bool:
+    """
+    Click a visible button matching `texts` / `aria` in one round-trip. Earlier
+    entries win; `aria` labels are tried after the texts unless `aria_first`.
+    """
+    cands = [[False, t] for t in texts]
+    labels = [[True, a] for a in aria]
+    cands = labels + cands if aria_first else cands + labels
+    try:
+        return bool(await page.evaluate(_CLICK_FIRST_BUTTON_JS, cands))
+    except PlaywrightError:
+        return False
+
+async def dismiss_signin_or_promos(page) -> None:
+    # One evaluate when no prompt is showing (the usual case). A sign-in prompt
+    # and a promo can be open together, so click until none is left (capped).
+    for _ in range(3):
+        if not await click_first_button(page, DISMISS_BUTTON_TEXTS):
+            break
+
+async def click_next_page_if_present(page) -> bool:
+    clicked = await click_first_button(page, NEXT_BUTTON_TEXTS, NEXT_BUTTON_ARIA, aria_first=True)
+    if clicked:
+        with suppress(PlaywrightError):
+            await page.wait_for_selector('[role="progressbar"]', timeout=3000, state="detached")
+    return clicked
 
 # =========================================================
 # Parsing (ratings & reviews)
 # =========================================================
 def _parse_rating_from_string(s: str) -> str | None:
-    """Return rating as 'X.Y' if present in localized string."""
+    """Return rating as 'X.Y' if present in localized string.
+
+    >>> _parse_rating_from_string("4,5 (1.234)")
+    '4.5'
+    >>> _parse_rating_from_string("٤٫٥ (١٬٢٣٤)")
+    '4.5'
+    """
     if not s:
         return None
     s_norm = _to_ascii_digits(s)
+    if not ANY_DIGIT_RE.search(s_norm):
+        return None
     m = RATING_RE.search(s_norm)
     if m:
         try:
@@ -381,8 +503,8 @@ def _parse_rating_from_string(s: str) -> str | None:
         except Exception:
             return None
     # Fallback: if any star word exists, pick first 0–5 floatish number
-    if any(w in s_norm.lower() for w in STAR_WORDS):
-        m2 = re.search(r"([0-5](?:[.,]\d)?)", s_norm)
+    if STAR_WORD_RE.search(s_norm.casefold()):
+        m2 = STAR_FALLBACK_RE.search(s_norm)
         if m2:
             try:
                 return f"{float(m2.group(1).replace(',', '.')):.1f}"
@@ -395,44 +517,91 @@ def _review_word_pattern() -> str:
     return _REVIEW_WORDS_ALT
 
 def _parse_reviews_from_string(s: str) -> int | None:
-    """Return review count (int) from EN/DE/FR/IT/ES localized strings."""
+    """Return review count (int) from EN/DE/FR/IT/ES localized strings.
+
+    >>> _parse_reviews_from_string("4.5 1.2K reviews")
+    1200
+    >>> _parse_reviews_from_string("Rated 4.6 2K reviews")
+    2000
+    >>> _parse_reviews_from_string("4.7(321)")
+    321
+    >>> _parse_reviews_from_string("3,4 Tsd. Bewertungen")
+    3400
+    >>> _parse_reviews_from_string("2 mila recensioni")
+    2000
+    >>> _parse_reviews_from_string("2 mila")
+    2000
+    >>> _parse_reviews_from_string("1.234 Bewertungen")
+    1234
+    >>> _parse_reviews_from_string("1 234 avis")
+    1234
+    >>> _parse_reviews_from_string("4,5 (1.234)")
+    1234
+    >>> _parse_reviews_from_string("Rated by 2,345 people")
+    2345
+    >>> _parse_reviews_from_string("٤٫٥ (١٬٢٣٤)")
+    1234
+    >>> _parse_reviews_from_string("١٬٢٣٤ reviews")
+    1234
+    >>> _parse_reviews_from_string("5 min") is None
+    True
+    >>> _parse_reviews_from_string("Write a review 1,234 reviews")
+    1234
+    >>> _parse_reviews_from_string("See all reviews · 1,234 reviews")
+    1234
+    >>> _parse_reviews_from_string("reviews reviews 100 note 4,5")
+    100
+    """
     if not s:
         return None
     s_norm = _to_ascii_digits(s)
+    if not ANY_DIGIT_RE.search(s_norm):
+        return None
+    # Only a compact match needs the review-word test, so strings without one
+    # skip the casefold.
+    compact = COMPACT_COUNT_RE.search(s_norm)
+    has_review_word = compact is not None and REVIEW_WORD_RE.search(s_norm.casefold()) is not None
 
     # 1) compact/spelled units + review word nearby
-    km = COMPACT_NUM_UNIT_RE.search(s_norm)
-    if km and any(w in s_norm.lower() for w in REVIEW_WORDS):
-        c = _parse_compact_count(km.group(1), km.group(2))
+    if compact and has_review_word:
+        c = _parse_compact_count(compact.group("compact"), compact.group("unit"))
         if c is not None:
             return c
 
+    # One pass for the rest: keep the first explicit and paren match that parses
+    # (the gap before an earlier review word, as in "Write a review", does not);
+    # every other match stays a candidate for the big-number fallback
+    explicit = paren = None
+    bigs = []
+    for m in REVIEW_COUNT_RE.finditer(s_norm):
+        if m.group("explicit") is not None and explicit is None:
+            explicit = _parse_plain_int(m.group("explicit"))
+            if explicit is not None:
+                continue
+        elif m.group("paren") is not None and paren is None:
+            paren = _parse_plain_int(m.group("paren"))
+            if paren is not None:
+                continue
+        bigs.append(m.group(m.lastindex))
+
     # 2) explicit "1,234 reviews" / "1.234 Bewertungen" / "1 234 avis" / "1.234 recensioni" / "1.234 reseñas"
-    m = EXPLICIT_NUM_REV_RE.search(s_norm)
-    if m:
-        c = _parse_plain_int(m.group(1))
-        if c is not None:
-            return c
+    if explicit is not None:
+        return explicit
 
     # 3) parentheses near ratings: "(1,234)"
-    pm = PAREN_NUM_RE.search(s_norm)
-    if pm:
-        c = _parse_plain_int(pm.group(1))
-        if c is not None:
-            return c
+    if paren is not None:
+        return paren
 
     # 4) compact count without review word, but with a unit somewhere
-    km2 = COMPACT_NUM_UNIT_RE.search(s_norm)
-    if km2:
-        c = _parse_compact_count(km2.group(1), km2.group(2))
+    if compact and not has_review_word:
+        c = _parse_compact_count(compact.group("compact"), compact.group("unit"))
         if c is not None:
             return c
 
     # 5) last resort: any large-ish number (avoid 4.5 ratings)
-    for token in BIG_NUM_RE.findall(s_norm):
+    for token in bigs:
         c = _parse_plain_int(token)
         if c and c >= 10:
             return c
 
     return None
- 
\ No newline at end of file
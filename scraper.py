@@ -1,28 +1,49 @@
 import re
 import csv
-import time
+import sys
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote_plus, urlsplit, unquote
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Error as PlaywrightError
 
 # Region-config & region-aware helpers
 from params import (
-    CITIES, KEYWORDS,
+    CITIES, EXACT_BOOLEAN_QUERY,
     SEARCH_THIS_AREA_TEXTS, COOKIE_ACCEPT_TEXTS,
     CITY_CENTER_LOOKUP,
-    dismiss_signin_or_promos, click_next_page_if_present,
-    _parse_rating_from_string, _parse_reviews_from_string,
-    STAR_WORDS,
+    dismiss_signin_or_promos, click_next_page_if_present, click_first_button,
+    _parse_rating_from_string, _parse_reviews_from_string, _nfc,
+    STAR_WORD_LITERAL_RE,
 )
 
 
 from config import (OUTPUT_CSV, HEADLESS, RATE_LIMIT_SEC, MAX_PER_CITY, 
-                    MAX_IDLE_ROUNDS, DEBUG_SHOTS, SHOW_TERMINAL_PREVIEW, 
+                    MAX_IDLE_ROUNDS, ADAPTIVE_IDLE, ADAPTIVE_IDLE_ALPHA,
+                    ADAPTIVE_IDLE_FLOOR, ADAPTIVE_IDLE_ROUNDS,
+                    DEBUG_SHOTS, SHOW_TERMINAL_PREVIEW, 
                     TERMINAL_PREVIEW_MAX, TERMINAL_COLUMNS, COL_WIDTHS, 
-                    DEFAULT_ZOOM)
+                    DEFAULT_ZOOM, CSV_BUFFER_BYTES,
+                    CITY_CONCURRENCY, POOL_SIZE, DETAIL_PAGES, BLOCK_RESOURCES,
+                    COORDS_CACHE, NAV_PER_SEC)
 
 
-EXACT_BOOLEAN_QUERY = " OR ".join(f"\"{t}\"" for t in KEYWORDS)
+# The keyword query is fixed for the whole run, so URL-encode it once
+ENCODED_BOOLEAN_QUERY = quote_plus(f"({EXACT_BOOLEAN_QUERY})")
+
+
+def _encode_query(boolean_query):
+    if boolean_query == EXACT_BOOLEAN_QUERY:
+        return ENCODED_BOOLEAN_QUERY
+    return quote_plus(f"({boolean_query})")
+
+
+@lru_cache(maxsize=None)
+def _encode_city(city):
+    """URL-encoded city name, computed once per city."""
+    return quote_plus(city)
 
 
 
@@ -31,6 +52,7 @@ def _clip(s, w):
     return s if len(s) <= w else (s[: max(0, w - 1)] + "…")
 
 
+@lru_cache(maxsize=4096)
 def _domain_or_url(u: str):
     try:
         netloc = urlsplit(u or "").netloc
@@ -42,36 +64,35 @@ def _domain_or_url(u: str):
 def print_table_header(city):
     if not SHOW_TERMINAL_PREVIEW:
         return
-    print(f"\n▶ Live results for {city} (showing first {TERMINAL_PREVIEW_MAX}):", flush=True)
+    print(f"\n▶ Live results for {city} (showing first {TERMINAL_PREVIEW_MAX}):")
     header = " | ".join(f"{h.upper():{COL_WIDTHS[h]}}" for h in TERMINAL_COLUMNS)
     rule = "-+-".join("-" * COL_WIDTHS[h] for h in TERMINAL_COLUMNS)
-    print(header, flush=True)
-    print(rule, flush=True)
+    print(header)
+    print(rule)
+
+
+# Row template and (column, width) pairs resolved once from config
+_ROW_FMT = " | ".join(f"{{:<{COL_WIDTHS[h]}}}" for h in TERMINAL_COLUMNS)
+_ROW_COLS = tuple((h, COL_WIDTHS[h]) for h in TERMINAL_COLUMNS)
 
 
 def print_table_row(d):
     if not SHOW_TERMINAL_PREVIEW:
         return
-    row_vals = {
-        "name": d.get("name", ""),
-        "rating": d.get("rating", ""),
-        "phone": d.get("phone", ""),
-        "website": _domain_or_url(d.get("website", "")),
-        "lat": d.get("lat", ""),
-        "lon": d.get("lon", ""),
-    }
-    line = " | ".join(_clip(str(row_vals[h]), COL_WIDTHS[h]).ljust(COL_WIDTHS[h]) for h in TERMINAL_COLUMNS)
-    print(line, flush=True)
+    print(_ROW_FMT.format(*[
+        _clip(str(_domain_or_url(d.get(h) or "") if h == "website" else d.get(h, "")), w)
+        for h, w in _ROW_COLS
+    ]))
 
 
 # =======================
 # Helpers
 # =======================
-def debug_shot(page, name):
+async def debug_shot(page, name):
     if not DEBUG_SHOTS:
         return
     try:
-        page.screenshot(path=f"debug_{name}.png", full_page=True)
+        await page.screenshot(path=f"debug_{name}.png", full_page=True)
     except Exception:
         pass
 
@@ -85,280 +106,373 @@ def _valid_latlon(lat, lon):
         return False
 
 
+# Coordinate patterns seen in Maps URLs, in the order they are tried
+_LATLON_AT_RE = re.compile(r"/@(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?),")
+_LATLON_3D4D_RE = re.compile(r"!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)")
+_LATLON_CENTER_RE = re.compile(r"center=(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)")
+_LATLON_LL_RE = re.compile(r"[?&]ll=(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)")
+_LATLON_RES = (_LATLON_AT_RE, _LATLON_3D4D_RE, _LATLON_CENTER_RE, _LATLON_LL_RE)
+
+PHONE_LABEL_RE = re.compile(r"Phone:\s*(.+)$")
+
+
 def _extract_latlon_from_text(txt: str):
     if not txt:
         return (None, None)
     s = unquote(txt)
 
-    m = re.search(r"/@(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?),", s)
-    if m and _valid_latlon(m.group(1), m.group(2)):
-        return (float(m.group(1)), float(m.group(2)))
-
-    m = re.search(r"!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)", s)
-    if m and _valid_latlon(m.group(1), m.group(2)):
-        return (float(m.group(1)), float(m.group(2)))
+    for rx in _LATLON_RES:
+        m = rx.search(s)
+        if m and _valid_latlon(m.group(1), m.group(2)):
+            return (float(m.group(1)), float(m.group(2)))
 
-    m = re.search(r"center=(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)", s)
-    if m and _valid_latlon(m.group(1), m.group(2)):
-        return (float(m.group(1)), float(m.group(2)))
+    return (None, None)
 
-    m = re.search(r"[?&]ll=(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)", s)
-    if m and _valid_latlon(m.group(1), m.group(2)):
-        return (float(m.group(1)), float(m.group(2)))
 
+def _first_latlon(texts):
+    for t in texts:
+        lat, lon = _extract_latlon_from_text(t)
+        if _valid_latlon(lat, lon):
+            return lat, lon
     return (None, None)
 
 
-def parse_coords_from_page(page):
+# og:image first, then every map link: the fallbacks after page.url, in one call
+_COORD_SOURCES_JS = """
+() => [
+  document.querySelector('meta[property="og:image"]')?.getAttribute('content') || '',
+  ...[...document.querySelectorAll('a[href*="/maps/"]')].map(e => e.href),
+]
+"""
+
+
+async def parse_coords_from_page(page):
     lat, lon = _extract_latlon_from_text(page.url)
     if _valid_latlon(lat, lon):
         return lat, lon
     try:
-        og = page.locator('meta[property="og:image"]').first
-        if og.count() > 0:
-            content = og.get_attribute("content") or ""
-            lat, lon = _extract_latlon_from_text(content)
-            if _valid_latlon(lat, lon):
-                return lat, lon
-    except Exception:
-        pass
-    try:
-        hrefs = page.eval_on_selector_all('a[href*="/maps/"]', "els => els.map(e => e.href)")
-        for h in hrefs:
-            lat, lon = _extract_latlon_from_text(h)
-            if _valid_latlon(lat, lon):
-                return lat, lon
+        sources = await gm_eval(page, "coordSources")
     except Exception:
-        pass
-    return (None, None)
+        return (None, None)
+    return _first_latlon(sources)
 
 
-def click_if_exists(page, selector: str, timeout_ms: int = 1500):
+async def click_if_exists(page, selector: str, timeout_ms: int = 1500):
     try:
         el = page.locator(selector).first
-        if el.count() > 0:
-            el.click(timeout=timeout_ms)
+        if await el.count() > 0:
+            await el.click(timeout=timeout_ms)
             return True
-    except Exception:
+    except PlaywrightError:  # also covers Playwright TimeoutError
         pass
     return False
 
 
-def accept_cookies_if_prompted(page):
-    if click_if_exists(page, '#L2AGLb', 2000):
+async def accept_cookies_if_prompted(page):
+    if await click_if_exists(page, '#L2AGLb', 2000):
         return
-    for txt in COOKIE_ACCEPT_TEXTS:
-        if click_if_exists(page, f'button:has-text("{txt}")', 2000):
-            return
-    click_if_exists(page, 'button[aria-label*="Accept"]', 2000)
+    # Every localized label (and the aria "Accept" fallback) in one round-trip
+    await click_first_button(page, COOKIE_ACCEPT_TEXTS, aria=["Accept"])
 
 
 # --- region-aware prompt dismissal imported from params.py ---
 
 
-def wait_for_results_ready(page, timeout=25000):
-    try:
-        page.wait_for_selector(
-            '[role="feed"] [role="article"], div.Nv2PK, a[href*="/maps/place/"]',
-            timeout=timeout
-        )
-    except PlaywrightTimeout:
-        pass
+# Resolves the moment `sel` appears (or, with `gone`, disappears) instead of polling;
+# resolves false after `t` ms.
+_WAIT_FOR_DOM_JS = """
+([sel, gone, t]) => new Promise(res => {
+  const ok = () => !!document.querySelector(sel) !== gone;
+  if (ok()) { res(true); return; }
+  const mo = new MutationObserver(() => {
+    if (ok()) { mo.disconnect(); clearTimeout(timer); res(true); }
+  });
+  const timer = setTimeout(() => { mo.disconnect(); res(false); }, t);
+  mo.observe(document, {childList: true, subtree: true});
+})
+"""
+
+
+async def wait_for_dom(page, selector, timeout=25000, gone=False):
+    """MutationObserver-driven wait for a selector to appear (or vanish with gone=True)."""
     try:
-        page.wait_for_selector('[role="progressbar"]', timeout=3000, state="detached")
-    except Exception:
-        pass
-    time.sleep(0.5)
+        return bool(await gm_eval(page, "waitForDom", [selector, gone, timeout]))
+    except PlaywrightError:  # e.g. the page navigated mid-wait
+        return False
+
+
+async def wait_for_results_ready(page, timeout=25000):
+    await wait_for_dom(page, '[role="feed"] [role="article"], div.Nv2PK, a[href*="/maps/place/"]', timeout)
+    await wait_for_dom(page, '[role="progressbar"]', 3000, gone=True)
 
 
 def normalize_city_key(city):
-    return (city or "").strip().lower()
+    return (city or "").strip().casefold()
 
 
 def city_center_from_table(city):
     return CITY_CENTER_LOOKUP.get(normalize_city_key(city))
 
 
-def goto_center(page, lat, lon, zoom=DEFAULT_ZOOM):
-    page.goto(f"https://www.google.com/maps/@{lat},{lon},{zoom}z?hl=en", timeout=60000)
-    wait_for_results_ready(page, timeout=20000)
-    time.sleep(0.4)
+# Centers geocoded on earlier runs for cities missing from params.py
+def _load_coord_cache(path):
+    try:
+        return {k: tuple(v) for k, v in json.loads(path.read_text(encoding="utf-8")).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+COORD_CACHE_PATH = Path(COORDS_CACHE) if COORDS_CACHE else None
+COORD_CACHE = _load_coord_cache(COORD_CACHE_PATH) if COORD_CACHE_PATH else {}
 
 
-def center_on_city(page, city):
+def city_center_from_cache(city):
+    return COORD_CACHE.get(normalize_city_key(city))
+
+
+def remember_city_center(city, lat, lon):
+    if COORD_CACHE_PATH is None:
+        return
+    COORD_CACHE[normalize_city_key(city)] = (lat, lon)
+    try:
+        COORD_CACHE_PATH.write_text(json.dumps(COORD_CACHE, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+async def goto_center(page, lat, lon, zoom=DEFAULT_ZOOM):
+    await page.goto(f"https://www.google.com/maps/@{lat},{lon},{zoom}z?hl=en", timeout=60000)
+    await wait_for_results_ready(page, timeout=20000)
+    await asyncio.sleep(0.4)
+
+
+async def center_on_city(page, city, coords=None):
     """
     Prefer static city centers (prevents location bias).
     Fallback to place page → parse coords, then recentre.
+    Pass `coords` when the caller already looked the city up; centers found by
+    geocoding are kept in COORDS_CACHE for the next run.
     """
-    coords = city_center_from_table(city)
+    coords = coords or city_center_from_table(city)
     if coords:
-        goto_center(page, coords[0], coords[1], DEFAULT_ZOOM)
+        await goto_center(page, coords[0], coords[1], DEFAULT_ZOOM)
         return coords
 
-    page.goto(f"https://www.google.com/maps/place/{quote_plus(city)}?hl=en", timeout=60000)
-    wait_for_results_ready(page, timeout=20000)
-    time.sleep(0.6)
-    lat, lon = parse_coords_from_page(page)
+    await page.goto(f"https://www.google.com/maps/place/{_encode_city(city)}?hl=en", timeout=60000)
+    await wait_for_results_ready(page, timeout=20000)
+    await asyncio.sleep(0.6)
+    lat, lon = await parse_coords_from_page(page)
     if _valid_latlon(lat, lon):
-        goto_center(page, lat, lon, DEFAULT_ZOOM)
+        remember_city_center(city, lat, lon)
+        await goto_center(page, lat, lon, DEFAULT_ZOOM)
         return (lat, lon)
     return (None, None)
 
 
-def run_boolean_query(page, city, boolean_query, lat=None, lon=None):
+def search_url(city, boolean_query, lat=None, lon=None):
+    """Search URL anchored at @lat,lon when known, else '<query> near <city>'."""
+    query = _encode_query(boolean_query)
+    if _valid_latlon(lat, lon):
+        return f"https://www.google.com/maps/search/{query}/@{lat},{lon},{DEFAULT_ZOOM}z?hl=en"
+    return f"https://www.google.com/maps/search/{query}+near+{_encode_city(city)}?hl=en"
+
+
+async def run_boolean_query(page, city, boolean_query, lat=None, lon=None):
     """
     Open a search URL anchored at @lat,lon to avoid re-bias to user's real location.
     """
-    query = f"({boolean_query})"
-    if _valid_latlon(lat, lon):
-        page.goto(
-            f"https://www.google.com/maps/search/{quote_plus(query)}/@{lat},{lon},{DEFAULT_ZOOM}z?hl=en",
-            timeout=60000
-        )
-    else:
-        page.goto(
-            f"https://www.google.com/maps/search/{quote_plus(query + ' near ' + city)}?hl=en",
-            timeout=60000
-        )
-    wait_for_results_ready(page, timeout=25000)
+    await page.goto(search_url(city, boolean_query, lat, lon), timeout=60000)
+    await wait_for_results_ready(page, timeout=25000)
 
-    for txt in SEARCH_THIS_AREA_TEXTS:
-        if click_if_exists(page, f'button:has-text("{txt}")', 1500):
-            wait_for_results_ready(page, timeout=15000)
-            break
+    if await click_first_button(page, SEARCH_THIS_AREA_TEXTS):
+        await wait_for_results_ready(page, timeout=15000)
 
 
-def fallback_direct_search(page, city, boolean_query, lat=None, lon=None):
-    if _valid_latlon(lat, lon):
-        url = f"https://www.google.com/maps/search/{quote_plus('(' + boolean_query + ')')}/@{lat},{lon},{DEFAULT_ZOOM}z?hl=en"
-    else:
-        url = f"https://www.google.com/maps/search/{quote_plus('(' + boolean_query + ') near ' + city)}?hl=en"
-    page.goto(url, timeout=60000)
-    wait_for_results_ready(page, timeout=25000)
+async def fallback_direct_search(page, city, boolean_query, lat=None, lon=None):
+    await page.goto(search_url(city, boolean_query, lat, lon), timeout=60000)
+    await wait_for_results_ready(page, timeout=25000)
 
 
-def get_results_scrollbox(page):
-    for sel in [
-        'div.m6QErb[aria-label]',  # common scrollbox
-        'div[role="feed"]',
-        'div.m6QErb',
-    ]:
-        el = page.locator(sel).first
-        if el.count() > 0:
-            return el
-    return None
+SCROLLBOX_SELECTORS = (
+    'div.m6QErb[aria-label]',  # common scrollbox
+    'div[role="feed"]',
+    'div.m6QErb',
+)
 
 
-def collect_current_place_urls(page):
-    urls = set()
+async def js_first_match(page, selectors):
+    """Index of the first selector with a match, in one round-trip (-1 = none)."""
     try:
-        hrefs = page.eval_on_selector_all(
-            '[role="feed"] [role="article"] a[href*="/maps/place/"]',
-            "els => els.map(e => e.href)"
+        return await page.evaluate(
+            "sels => sels.findIndex(s => document.querySelector(s) !== null)", list(selectors)
         )
-        for h in hrefs:
-            urls.add(h.split("&")[0])
-    except Exception:
-        pass
+    except PlaywrightError:
+        return -1
+
+
+async def find_results_scrollbox(page):
+    """(index into SCROLLBOX_SELECTORS, locator) for the results box; (-1, None) if none."""
+    i = await js_first_match(page, SCROLLBOX_SELECTORS)
+    return (i, page.locator(SCROLLBOX_SELECTORS[i]).first) if i >= 0 else (-1, None)
+
+
+# Place anchors from the first selector that finds any (feed articles, then cards,
+# then bare place links), skipping the `skip` anchors already read on earlier
+# ticks, so each scroll tick costs O(new cards) rather than O(feed). A shorter
+# feed or a different first anchor means the feed was replaced (next page,
+# "Search this area"), and it is read from the top again.
+_PLACE_HREFS_JS = """
+([skip, first]) => {
+  let els = document.querySelectorAll('[role="feed"] [role="article"] a[href*="/maps/place/"]');
+  if (!els.length) els = document.querySelectorAll('div.Nv2PK a[href*="/maps/place/"]');
+  if (!els.length) els = document.querySelectorAll('a[href*="/maps/place/"]');
+  const head = els.length ? els[0].href : '';
+  if (els.length < skip || head !== first) skip = 0;
+  const out = new Set();
+  for (let i = skip; i < els.length; i++) out.add(els[i].href.split('&')[0]);
+  return [els.length, head, [...out]];
+}
+"""
+
+
+async def collect_new_place_urls(page, cursor=(0, "")):
+    """
+    '&'-trimmed place URLs added since `cursor` (unique list), plus the cursor
+    for the next call; the default cursor reads everything.
+    """
     try:
-        hrefs = page.eval_on_selector_all(
-            'div.Nv2PK a[href*="/maps/place/"]',
-            "els => els.map(e => e.href)"
-        )
-        for h in hrefs:
-            urls.add(h.split("&")[0])
+        n, head, urls = await gm_eval(page, "placeHrefs", list(cursor))
     except Exception:
-        pass
-    if not urls:
-        try:
-            hrefs = page.eval_on_selector_all(
-                'a[href*="/maps/place/"]',
-                "els => els.map(e => e.href)"
-            )
-            for h in hrefs:
-                urls.add(h.split("&")[0])
-        except Exception:
-            pass
-    return urls
+        return [], cursor
+    return urls, (n, head)
+
+
+async def collect_current_place_urls(page):
+    """Deduped, '&'-trimmed place URLs currently in the DOM (a list, already unique)."""
+    return (await collect_new_place_urls(page))[0]
 
 
 # --- region-aware pagination 'Next' imported from params.py ---
 
-def scroll_and_collect_place_urls(page, cap=MAX_PER_CITY):
-    urls = set()
+# Scroll the results box, then return as soon as more place links are in it, or
+# after `t` ms. A round that finds nothing still waits the full time, so
+# MAX_IDLE_ROUNDS keeps its meaning.
+_SCROLL_AND_WAIT_JS = """
+(el, t) => new Promise(res => {
+  const count = () => el.querySelectorAll('a[href*="/maps/place/"]').length;
+  const before = count();
+  const mo = new MutationObserver(() => {
+    if (count() > before) { mo.disconnect(); clearTimeout(timer); res(true); }
+  });
+  const timer = setTimeout(() => { mo.disconnect(); res(false); }, t);
+  mo.observe(el, {childList: true, subtree: true});
+  el.scrollBy(0, el.scrollHeight);
+})
+"""
+SCROLL_EVAL_TIMEOUT_MS = 5000  # a vanished box fails in this long, not the default 30 s
+
+async def iter_place_urls(page, cap=MAX_PER_CITY):
+    """
+    Scroll the results and yield each tick's newly found place URLs (a list) as
+    soon as they show up, so detail extraction can run while scrolling goes on.
+    """
+    seen = set()
     idle_rounds = 0
-    last_count = 0
+    # EWMA of "this round found something new", starting out productive; a lone
+    # straggler only nudges it instead of resetting the count like idle_rounds
+    yield_rate = 1.0
+    low_rounds = 0  # rounds in a row with yield_rate below ADAPTIVE_IDLE_FLOOR
+
+    def fresh(found):
+        new = [u for u in found if u not in seen][: cap - len(seen)]
+        seen.update(new)
+        return new
 
-    scrollbox = get_results_scrollbox(page)
+    async def scroll_and_wait(box):
+        try:
+            await gm_eval(box, "scrollAndWait", 1100, on_element=True, timeout=SCROLL_EVAL_TIMEOUT_MS)
+            return True
+        except Exception:
+            return False
+
+    box_i, scrollbox = await find_results_scrollbox(page)
     if scrollbox is None:
-        return list(collect_current_place_urls(page))[:cap]
+        new = fresh(await collect_current_place_urls(page))
+        if new:
+            yield new
+        return
 
+    cursor = (0, "")
     for _ in range(200):  # upper bound
-        urls |= collect_current_place_urls(page)
+        found, cursor = await collect_new_place_urls(page, cursor)
+        new = fresh(found)
+        if new:
+            yield new
 
-        if len(urls) >= cap:
+        if len(seen) >= cap:
             break
 
-        if len(urls) == last_count:
-            idle_rounds += 1
-        else:
-            idle_rounds = 0
-            last_count = len(urls)
-
-        if idle_rounds > 1:
-            for txt in SEARCH_THIS_AREA_TEXTS:
-                if click_if_exists(page, f'button:has-text("{txt}")', 1200):
-                    wait_for_results_ready(page, timeout=10000)
-                    idle_rounds = 0
-                    break
-
-        if idle_rounds >= MAX_IDLE_ROUNDS:
-            if click_next_page_if_present(page):
-                idle_rounds = 0
+        idle_rounds = 0 if new else idle_rounds + 1
+        yield_rate += ADAPTIVE_IDLE_ALPHA * (bool(new) - yield_rate)
+        low_rounds = low_rounds + 1 if yield_rate < ADAPTIVE_IDLE_FLOOR else 0
+
+        if idle_rounds > 1 and await click_first_button(page, SEARCH_THIS_AREA_TEXTS):
+            await wait_for_results_ready(page, timeout=10000)
+            # The rate predates the reload; collect what it loaded first
+            idle_rounds, yield_rate, low_rounds = 0, 1.0, 0
+            continue
+
+        plateaued = ADAPTIVE_IDLE and low_rounds >= ADAPTIVE_IDLE_ROUNDS
+
+        if idle_rounds >= MAX_IDLE_ROUNDS or plateaued:
+            if await click_next_page_if_present(page):
+                idle_rounds, yield_rate, low_rounds = 0, 1.0, 0
                 continue
             else:
                 break
 
-        try:
-            scrollbox.evaluate("el => el.scrollBy(0, el.scrollHeight)")
-        except Exception:
-            page.mouse.wheel(0, 1800)
-
-        time.sleep(1.1)
+        if await scroll_and_wait(scrollbox):
+            continue
+        # The locator re-resolves on every call, so a failure means its selector
+        # no longer matches (e.g. the panel was rebuilt). Retrying is only worth
+        # it when a different selector now finds the box.
+        i, box = await find_results_scrollbox(page)
+        if i >= 0 and i != box_i:
+            box_i, scrollbox = i, box
+            if await scroll_and_wait(scrollbox):
+                continue
+        await page.mouse.wheel(0, 1800)
+        await asyncio.sleep(1.1)
 
-    return list(urls)[:cap]
 
-
-def safe_text(locator, default=""):
-    try:
-        if locator.count() > 0:
-            txt = locator.first.inner_text().strip()
-            if txt:
-                return txt
-    except Exception:
-        pass
-    return default
+# Rating-row texts first; then the panel's spans and buttons (where the numbers
+# live) instead of every descendant, at most SHORT_TEXTS_MAX of them
+TEXT_SCOPES = ('div[role="main"] div.F7nice *', 'div[role="main"] span, div[role="main"] button')
+SHORT_TEXTS_MAX = 200
+_SHORT_TEXTS_JS = f"""
+els => els.map(e => (e.innerText || '').trim()).filter(t => t && t.length <= 120).slice(0, {SHORT_TEXTS_MAX})
+"""
 
 
-def extract_rating_reviews(page):
+async def extract_rating_reviews(page, labels=None, header_texts=None):
     """
-    Locale-aware rating & review extraction using region parsers from params.py
+    Locale-aware rating & review extraction using region parsers from params.py.
+    Pass `labels` / `header_texts` (the TEXT_SCOPES[0] texts) when already read.
     """
     rating, reviews = None, None
 
-    # 1) aria-labels in the details area
-    selectors = [
-        'div[role="main"] [aria-label]',
-        'div[role="main"] button[aria-label]',
-        'div[role="main"] div[aria-label]',
-        'div[role="main"] span[aria-label]',
-    ]
-    labels = []
-    for sel in selectors:
+    # 1) aria-labels in the details area (the button/div/span-only selectors
+    #    used to be queried too, but they are subsets of this one)
+    if labels is None:
         try:
-            labels += page.eval_on_selector_all(sel, "els => els.map(e => e.getAttribute('aria-label'))")
+            labels = await page.eval_on_selector_all(
+                'div[role="main"] [aria-label]', "els => els.map(e => e.getAttribute('aria-label'))"
+            )
         except Exception:
-            pass
+            labels = []
+
+    # NFC once per page so accented review/star words compare like the params tables
+    labels = [_nfc(s) for s in labels]
 
     for s in labels:
         if rating is None:
@@ -368,17 +482,21 @@ def extract_rating_reviews(page):
         if rating and reviews:
             break
 
-    # 2) visible texts near the header
-    if rating is None or reviews is None:
-        try:
-            texts = page.eval_on_selector_all(
-                'div[role="main"] *',
-                "els => els.map(e => (e.innerText || '').trim()).filter(t => t && t.length <= 120)"
-            )
-        except Exception:
-            texts = []
+    # 2) visible texts near the header: the rating/reviews row first, and the
+    #    rest of the details panel only if that row falls short
+    for scope in TEXT_SCOPES:
+        if rating is not None and reviews is not None:
+            break
+        if scope == TEXT_SCOPES[0] and header_texts is not None:
+            texts = header_texts
+        else:
+            try:
+                texts = await page.eval_on_selector_all(scope, _SHORT_TEXTS_JS)
+            except Exception:
+                texts = []
+        texts = [_nfc(s) for s in texts]
         for s in texts:
-            if rating is None and any(w in s for w in STAR_WORDS):
+            if rating is None and STAR_WORD_LITERAL_RE.search(s):
                 rating = rating or _parse_rating_from_string(s)
             if reviews is None:
                 candidate = _parse_reviews_from_string(s)
@@ -390,13 +508,8 @@ def extract_rating_reviews(page):
     return rating, reviews
 
 
-# --------------------------------------------------
-def extract_details_from_place(page, place_url):
-    page.goto(place_url, timeout=60000)
-    page.wait_for_selector('h1, h1[class*="DUwDvf"]', timeout=20000)
-    time.sleep(RATE_LIMIT_SEC)
-
-    details = {
+def blank_details(place_url):
+    return {
         "name": "",
         "address": "",
         "phone": "",
@@ -414,215 +527,510 @@ def extract_details_from_place(page, place_url):
         "line": "",
     }
 
-    details["name"] = safe_text(page.locator('h1[class*="DUwDvf"]')) or safe_text(page.locator('h1'))
 
-    r, rc = extract_rating_reviews(page)
+# One pass over the result cards still in the feed; the rating/reviews label is
+# parsed in Python so the locale tables in params.py apply.
+_FEED_CARDS_JS = """
+(wanted) => {
+  const want = wanted ? new Set(wanted) : null;
+  const cards = new Set(document.querySelectorAll('[role="feed"] [role="article"], div.Nv2PK'));
+  const out = [];
+  for (const card of cards) {
+    const a = card.querySelector('a[href*="/maps/place/"]');
+    if (!a) continue;
+    const url = a.href.split('&')[0];
+    if (want && !want.has(url)) continue;
+    const q = (sel) => card.querySelector(sel);
+    out.push({
+      url,
+      name: (a.getAttribute('aria-label') || q('.qBF1Pd')?.innerText || '').trim(),
+      stars: q('[role="img"][aria-label]')?.getAttribute('aria-label') || '',
+      website: q('a[data-value="Website"]')?.href || '',
+      phone: (q('.UsdlK')?.innerText || '').trim(),
+    });
+  }
+  return out;
+}
+"""
+
+
+async def harvest_feed_cards(page, urls=None):
+    """Map place URL → details prefilled from its feed card (no navigation); all cards, or just `urls`."""
+    try:
+        cards = await gm_eval(page, "feedCards", list(urls) if urls is not None else None)
+    except PlaywrightError:
+        return {}
+    harvested = {}
+    for c in cards:
+        d = blank_details(c["url"])
+        d["name"] = c["name"]
+        d["website"] = c["website"]
+        d["phone"] = c["phone"]
+        stars = _nfc(c["stars"])
+        d["rating"] = _parse_rating_from_string(stars) or ""
+        rc = _parse_reviews_from_string(stars)
+        d["reviews_count"] = rc if rc is not None else ""
+        lat, lon = _extract_latlon_from_text(c["url"])
+        d["lat"] = lat if lat is not None else ""
+        d["lon"] = lon if lon is not None else ""
+        harvested[c["url"]] = d
+    return harvested
+
+
+SOCIAL_HOSTS = {
+    "facebook": ("facebook.com", "fb.com"),
+    "instagram": ("instagram.com",),
+    "twitter_or_x": ("twitter.com", "x.com"),
+    "tiktok": ("tiktok.com",),
+    "youtube": ("youtube.com", "youtu.be"),
+    "line": ("line.me",),
+}
+# Inverted for lookup by registrable host: 'm.facebook.com' → 'facebook'
+HOST_TO_KEY = {host: key for key, hosts in SOCIAL_HOSTS.items() for host in hosts}
+# One C-level search per link: a known host or any subdomain of it, anchored at a
+# label boundary so 'box.com' is not taken for 'x.com'
+SOCIAL_HOST_RE = re.compile(
+    r"(?:^|\.)(" + "|".join(re.escape(h) for h in sorted(HOST_TO_KEY, key=len, reverse=True)) + r")$"
+)
+
+
+# Host of an http(s) link without urlsplit: userinfo skipped, stops at port/path
+LINK_HOST_RE = re.compile(r"https?://(?:[^@/?#]*@)?([^:/?#]*)", re.IGNORECASE)
+
+
+def _social_key(host):
+    """SOCIAL_HOSTS key for `host` or any parent domain of it, else None."""
+    m = SOCIAL_HOST_RE.search(host)
+    return HOST_TO_KEY[m.group(1)] if m else None
+
+# Everything extract_details_from_place reads off a place page, in one DOM scan
+# (previously ~15 locator/get_attribute round-trips per place). The two bulky
+# lists are pre-filtered in the page so only candidates cross the wire: labels
+# need a digit for either parser to match, and map links need (possibly
+# percent-encoded) text of one of the _LATLON_RES patterns. headerTexts are the
+# TEXT_SCOPES[0] texts, which the rating fallback would otherwise fetch separately.
+_PLACE_DETAILS_JS = """
+() => {
+  const HAS_DIGIT = /\\p{Nd}/u;
+  const HAS_COORDS = /@|%40|!3d|%213d|center=|center%3d|ll=|ll%3d/i;
+  const q = (sel) => document.querySelector(sel);
+  const txt = (sel) => (q(sel)?.innerText || '').trim();
+  const attr = (sel, name) => q(sel)?.getAttribute(name) || '';
+  const all = (sel, fn) => [...document.querySelectorAll(sel)].map(fn);
+  const phoneBtn = q('button[data-item-id^="phone:"]');
+  return {
+    name: txt('h1[class*="DUwDvf"]') || txt('h1'),
+    address: txt('button[data-item-id="address"]') || txt('div[data-item-id="address"]'),
+    addressLabel: attr('button[aria-label^="Address:"]', 'aria-label'),
+    phoneLabel: phoneBtn ? (phoneBtn.getAttribute('aria-label') || '') : null,
+    phoneText: phoneBtn ? (phoneBtn.innerText || '').trim() : '',
+    tel: attr('a[href^="tel:"]', 'href'),
+    website: attr('a[data-item-id="authority"]', 'href') || attr('a[aria-label^="Website:"]', 'href'),
+    ogImage: attr('meta[property="og:image"]', 'content'),
+    mapHrefs: all('a[href*="/maps/"]', e => e.href).filter(h => HAS_COORDS.test(h)),
+    labels: all('div[role="main"] [aria-label]', e => e.getAttribute('aria-label'))
+      .filter(t => HAS_DIGIT.test(t)),
+    headerTexts: all('div[role="main"] div.F7nice *', e => (e.innerText || '').trim())
+      .filter(t => t && t.length <= 120),
+    links: all('div[role="main"] a[href^="http"]', e => e.getAttribute('href') || ''),
+  };
+}
+"""
+
+
+class RateLimiter:
+    """Hands out start slots at most `rate` per second, shared by every city and tab."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+NAV_LIMITER = RateLimiter(NAV_PER_SEC)
+
+
+# --------------------------------------------------
+async def extract_details_from_place(page, place_url):
+    await NAV_LIMITER.wait()
+    await page.goto(place_url, timeout=60000)
+    await page.wait_for_selector('h1, h1[class*="DUwDvf"]', timeout=20000)
+    await asyncio.sleep(RATE_LIMIT_SEC)
+
+    details = blank_details(place_url)
+    raw = await gm_eval(page, "placeDetails")
+
+    details["name"] = raw["name"]
+
+    r, rc = await extract_rating_reviews(page, raw["labels"], raw["headerTexts"])
     details["rating"] = r or ""
     details["reviews_count"] = rc if rc is not None else ""
 
-    addr = safe_text(page.locator('button[data-item-id="address"]')) \
-        or safe_text(page.locator('div[data-item-id="address"]'))
-    if not addr:
-        try:
-            al = page.locator('button[aria-label^="Address:"]').first.get_attribute("aria-label")
-            if al:
-                addr = al.replace("Address:", "").strip()
-        except Exception:
-            pass
+    addr = raw["address"]
+    if not addr and raw["addressLabel"]:
+        addr = raw["addressLabel"].replace("Address:", "").strip()
     details["address"] = addr
 
     phone = ""
-    try:
-        phone_btn = page.locator('button[data-item-id^="phone:"]').first
-        if phone_btn.count() > 0:
-            al = phone_btn.get_attribute("aria-label") or ""
-            m = re.search(r"Phone:\s*(.+)$", al)
-            phone = m.group(1).strip() if m else safe_text(phone_btn)
-    except Exception:
-        pass
+    if raw["phoneLabel"] is not None:
+        m = PHONE_LABEL_RE.search(raw["phoneLabel"])
+        phone = m.group(1).strip() if m else raw["phoneText"]
     if not phone:
-        try:
-            tel = page.locator('a[href^="tel:"]').first
-            if tel.count() > 0:
-                phone = (tel.get_attribute("href") or "").replace("tel:", "")
-        except Exception:
-            pass
+        phone = raw["tel"].replace("tel:", "")
     details["phone"] = phone
 
-    website = ""
-    try:
-        site_link = page.locator('a[data-item-id="authority"]').first
-        if site_link.count() > 0:
-            website = site_link.get_attribute("href") or ""
-    except Exception:
-        pass
-    if not website:
-        try:
-            site_link = page.locator('a[aria-label^="Website:"]').first
-            if site_link.count() > 0:
-                website = site_link.get_attribute("href") or ""
-        except Exception:
-            pass
-    details["website"] = website
+    details["website"] = raw["website"]
 
-    lat, lon = parse_coords_from_page(page)
+    # Same order as parse_coords_from_page: URL, og:image, then map links
+    lat, lon = _first_latlon([page.url, raw["ogImage"], *raw["mapHrefs"]])
     details["lat"] = lat if lat is not None else ""
     details["lon"] = lon if lon is not None else ""
 
-    social_map = {
-        "facebook": ("facebook.com", "fb.com"),
-        "instagram": ("instagram.com",),
-        "twitter_or_x": ("twitter.com", "x.com"),
-        "tiktok": ("tiktok.com",),
-        "youtube": ("youtube.com", "youtu.be"),
-        "line": ("line.me",),
-    }
-    try:
-        anchors = page.locator('div[role="main"] a[href^="http"]').all()
-    except Exception:
-        anchors = []
-    for a in anchors:
-        try:
-            href = a.get_attribute("href") or ""
-        except Exception:
-            href = ""
+    for href in raw["links"]:
         if not href:
             continue
-        host = urlsplit(href).netloc.lower()
-        for key, host_hints in social_map.items():
-            if details[key]:
-                continue
-            if any(h in host for h in host_hints):
-                details[key] = href
+        m = LINK_HOST_RE.match(href)
+        key = _social_key(m.group(1).lower()) if m else None
+        if key and not details[key]:
+            details[key] = href
 
     return details
 
 
+CSV_FIELDS = (
+    "city", "name", "address", "phone", "website", "rating", "reviews_count",
+    "lat", "lon", "google_maps_url", "facebook", "instagram", "twitter_or_x",
+    "tiktok", "youtube", "line",
+)
+
+
 def write_csv_header(path: Path):
     if path.exists():
         return
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
-        w.writerow([
-            "city", "name", "address", "phone", "website", "rating", "reviews_count",
-            "lat", "lon", "google_maps_url", "facebook", "instagram", "twitter_or_x",
-            "tiktok", "youtube", "line"
-        ])
+        w.writerow(CSV_FIELDS)
 
 
-def append_rows(path: Path, rows):
-    if not rows:
-        return
-    with path.open("a", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        for r in rows:
-            w.writerow([
-                r.get("city", ""), r.get("name", ""), r.get("address", ""), r.get("phone", ""),
-                r.get("website", ""), r.get("rating", ""), r.get("reviews_count", ""),
-                r.get("lat", ""), r.get("lon", ""), r.get("google_maps_url", ""),
-                r.get("facebook", ""), r.get("instagram", ""), r.get("twitter_or_x", ""),
-                r.get("tiktok", ""), r.get("youtube", ""), r.get("line", ""),
-            ])
+# =======================
+# In-page helpers
+# =======================
+# The hot JS helpers, installed once per context as window.__gm by an init script,
+# so each call ships a one-line expression instead of the function source
+GM_HELPERS = {
+    "coordSources": _COORD_SOURCES_JS,
+    "waitForDom": _WAIT_FOR_DOM_JS,
+    "placeHrefs": _PLACE_HREFS_JS,
+    "scrollAndWait": _SCROLL_AND_WAIT_JS,
+    "feedCards": _FEED_CARDS_JS,
+    "placeDetails": _PLACE_DETAILS_JS,
+}
+_GM_MISSING = "__gm missing__"
+GM_INIT_SCRIPT = "window.__gm = {\n" + ",\n".join(
+    f"{name}: {src.strip()}" for name, src in GM_HELPERS.items()
+) + "\n};"
+
+
+async def gm_eval(target, name, arg=None, on_element=False, timeout=None):
+    """
+    Call GM_HELPERS[name] on a page (or, with on_element, on a locator's element;
+    `timeout` then bounds the wait for that element, in ms).
+    Documents without window.__gm get the full source instead.
+    """
+    args = "el, a" if on_element else "a"
+    call = f"({args}) => window.__gm ? window.__gm.{name}({args}) : {_GM_MISSING!r}"
+    kw = {"timeout": timeout} if timeout is not None else {}
+    result = await target.evaluate(call, arg, **kw)
+    if result == _GM_MISSING:
+        result = await target.evaluate(GM_HELPERS[name], arg, **kw)
+    return result
 
 
 # =======================
-# Main
+# Browser pools
 # =======================
-def main():
-    out_path = Path(OUTPUT_CSV)
-    write_csv_header(out_path)
+CONTEXT_KWARGS = {
+    "locale": "en-US",
+    "viewport": {"width": 1500, "height": 950},
+    "user_agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/124.0.0.0 Safari/537.36"),
+    "permissions": ["geolocation"],
+    # Service-worker fetches would bypass the context route that blocks heavy requests
+    "service_workers": "block",
+}
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-extensions",
+]
+if HEADLESS:
+    LAUNCH_ARGS.append("--disable-gpu")  # headed runs keep the GPU for the map canvas
+
+
+# Nothing the scraper reads needs these. Stylesheets stay: without them the
+# results panel is not a scroll container and lazy loading stalls.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_RE = re.compile(r"doubleclick\.net|google-analytics\.com|googletagmanager\.com")
+
+
+async def _block_heavy_requests(route):
+    req = route.request
+    if req.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(req.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def context_pool(browser, size):
+    """Pre-create `size` contexts on one browser; yields a queue of ready contexts."""
+    contexts = [await browser.new_context(**CONTEXT_KWARGS) for _ in range(size)]
+    for ctx in contexts:
+        await ctx.add_init_script(GM_INIT_SCRIPT)
+    if BLOCK_RESOURCES:
+        for ctx in contexts:
+            await ctx.route("**/*", _block_heavy_requests)
+    ready = asyncio.Queue()
+    for ctx in contexts:
+        ready.put_nowait(ctx)
+    try:
+        yield ready
+    finally:
+        for ctx in contexts:
+            try:
+                await ctx.close()
+            except PlaywrightError:
+                pass
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=HEADLESS,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ]
-        )
 
-        # Fresh browser context **per city** with spoofed geolocation (if available)
-        for city in CITIES:
-            city_latlon = city_center_from_table(city)
+@asynccontextmanager
+async def pooled(ready):
+    """Borrow one item from a pool queue and hand it back afterwards."""
+    item = await ready.get()
+    try:
+        yield item
+    finally:
+        ready.put_nowait(item)
 
-            context_kwargs = {
-                "locale": "en-US",
-                "viewport": {"width": 1500, "height": 950},
-                "user_agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                               "AppleWebKit/537.36 (KHTML, like Gecko) "
-                               "Chrome/124.0.0.0 Safari/537.36"),
-            }
-            if city_latlon:
-                context_kwargs["geolocation"] = {"latitude": city_latlon[0], "longitude": city_latlon[1]}
-                context_kwargs["permissions"] = ["geolocation"]
 
-            context = browser.new_context(**context_kwargs)
-            page = context.new_page()
+async def reset_context_for_city(context, city_latlon):
+    """
+    Swap a pooled context (and its open tabs) over to a new city instead of
+    rebuilding it; geolocation permission was granted once at creation.
+    """
+    await context.clear_cookies()
+    if city_latlon:
+        await context.set_geolocation({"latitude": city_latlon[0], "longitude": city_latlon[1]})
+    else:
+        await context.set_geolocation(None)  # position unavailable, as with no permission
 
-            try:
-                print(f"\n=== Processing city: {city} ===")
-                page.goto("https://www.google.com/maps?hl=en", timeout=60000)
-                accept_cookies_if_prompted(page)
-                dismiss_signin_or_promos(page)
 
-                lat, lon = center_on_city(page, city)  # recenters
-                if city_latlon and not _valid_latlon(lat, lon):
-                    lat, lon = city_latlon
+def card_is_enough(card):
+    """With DETAIL_PAGES off, a named feed card is the whole row."""
+    return bool(card and card["name"] and not DETAIL_PAGES)
 
-                run_boolean_query(page, city, EXACT_BOOLEAN_QUERY, lat=lat, lon=lon)
 
-                if page.locator('[role="feed"], div.Nv2PK, a[href*="/maps/place/"]').count() == 0:
-                    fallback_direct_search(page, city, EXACT_BOOLEAN_QUERY, lat=lat, lon=lon)
+class TabPool:
+    """
+    A city's detail tabs: tabs left open by earlier cities on this context first
+    (pages[0] is the search page), more opened on demand up to `size`.
+    """
 
-                print("Scrolling results and collecting place URLs…", flush=True)
-                urls = scroll_and_collect_place_urls(page, cap=MAX_PER_CITY)
-                print(f"Found {len(urls)} place URLs for {city}", flush=True)
+    def __init__(self, context, size):
+        self.context = context
+        self.size = size
+        self.ready = asyncio.Queue()
+        spare = context.pages[1:1 + size]
+        for t in spare:
+            self.ready.put_nowait(t)
+        self.opened = len(spare)
+
+    @asynccontextmanager
+    async def tab(self):
+        if self.ready.empty() and self.opened < self.size:
+            self.opened += 1
+            page = await self.context.new_page()
+        else:
+            page = await self.ready.get()
+        try:
+            yield page
+        finally:
+            self.ready.put_nowait(page)
 
-                # Live terminal table
-                printed_for_city = 0
-                print_table_header(city)
 
-                city_rows = []
-                seen_keys = set()
+async def extract_details_pooled(tabs, place_url, card=None):
+    """
+    extract_details_from_place on whichever tab of the city's pool is free.
+    With DETAIL_PAGES off, a named feed card is used as-is and nothing is opened.
+    """
+    if card_is_enough(card):
+        return card
+    async with tabs.tab() as page:
+        try:
+            d = await extract_details_from_place(page, place_url)
+        except Exception:
+            await asyncio.sleep(0.4)
+            raise
+    for k, v in (card or {}).items():  # the card fills whatever the place page missed
+        if v != "" and d.get(k) in ("", None):
+            d[k] = v
+    return d
+
 
-                for idx, u in enumerate(urls, 1):
+# =======================
+# Main
+# =======================
+async def process_city(contexts, city, out_f, out_csv, seen_urls):
+    """
+    Scrape one city on a pooled context; at most CITY_CONCURRENCY run at once.
+    `seen_urls` is shared by all cities, so a place is only visited once per run.
+    """
+    async with pooled(contexts) as context:
+        city_latlon = city_center_from_table(city) or city_center_from_cache(city)
+        await reset_context_for_city(context, city_latlon)
+
+        # Pages outlive the city too; the pool closes them with their context
+        page = context.pages[0] if context.pages else await context.new_page()
+
+        try:
+            print(f"\n=== Processing city: {city} ===")
+            await page.goto("https://www.google.com/maps?hl=en", timeout=60000)
+            await accept_cookies_if_prompted(page)
+            await dismiss_signin_or_promos(page)
+
+            lat, lon = await center_on_city(page, city, city_latlon)  # recenters
+            if city_latlon and not _valid_latlon(lat, lon):
+                lat, lon = city_latlon
+
+            await run_boolean_query(page, city, EXACT_BOOLEAN_QUERY, lat=lat, lon=lon)
+
+            if await page.locator('[role="feed"], div.Nv2PK, a[href*="/maps/place/"]').count() == 0:
+                await fallback_direct_search(page, city, EXACT_BOOLEAN_QUERY, lat=lat, lon=lon)
+
+            print(f"Scrolling results and collecting place URLs for {city}…")
+
+            # Live terminal table
+            printed_for_city = 0
+            print_table_header(city)
+
+            seen_keys = set()
+            found = 0
+            done = 0
+
+            # Pipeline: the scroller streams URLs (with whatever their feed card
+            # shows) into a queue while POOL_SIZE workers extract details on the
+            # tab pool, so the scroll tail overlaps extraction. Tabs open lazily,
+            # so a feed-only run opens none.
+            todo = asyncio.Queue()
+            tabs = TabPool(context, POOL_SIZE)
+
+            async def produce():
+                nonlocal found
+                try:
+                    async for batch in iter_place_urls(page, cap=MAX_PER_CITY):
+                        # Skip places another city already queued (chains near city edges)
+                        batch = [u for u in batch if u not in seen_urls]
+                        seen_urls.update(batch)
+                        if not batch:
+                            continue
+                        cards = await harvest_feed_cards(page, batch)
+                        for u in batch:
+                            todo.put_nowait((u, cards.get(u)))
+                        found += len(batch)
+                    print(f"Found {found} place URLs for {city}")
+                finally:
+                    for _ in range(POOL_SIZE):
+                        todo.put_nowait(None)
+
+            async def consume():
+                nonlocal printed_for_city, done
+                while True:
+                    item = await todo.get()
+                    if item is None:
+                        return
+                    u, card = item
                     try:
-                        d = extract_details_from_place(page, u)
+                        d = await extract_details_pooled(tabs, u, card)
+                        done += 1
                         d["city"] = city
                         key = (d.get("name", "").lower().strip(), d.get("lat", ""), d.get("lon", ""))
                         if key in seen_keys:
                             continue
                         seen_keys.add(key)
-                        city_rows.append(d)
-
-                        if len(city_rows) % 10 == 0:
-                            append_rows(out_path, city_rows)
-                            city_rows = []
+                        # Synchronous write through the run's buffered DictWriter (flushed per
+                        # city), so rows of concurrent cities never interleave mid-row
+                        out_csv.writerow(d)
 
                         if printed_for_city < TERMINAL_PREVIEW_MAX:
                             print_table_row(d)
                             printed_for_city += 1
                         else:
-                            print(f"[{idx}/{len(urls)}] {d.get('name','(no name)')} ({d.get('lat','')},{d.get('lon','')})", flush=True)
-
-                        time.sleep(RATE_LIMIT_SEC)
+                            print(f"[{city} {done}/{found}] {d.get('name','(no name)')} ({d.get('lat','')},{d.get('lon','')})")
                     except Exception as e:
-                        print(f"  -> Skipped due to error: {e}", flush=True)
-                        time.sleep(0.4)
+                        # Release the claim so a neighbouring city can still pick it up
+                        seen_urls.discard(u)
+                        print(f"  -> Skipped due to error: {e}")
                         continue
 
-                if city_rows:
-                    append_rows(out_path, city_rows)
+            workers = [asyncio.create_task(consume()) for _ in range(POOL_SIZE)]
+            try:
+                await produce()
+            finally:
+                # Even if scrolling failed, let the workers drain what was queued
+                # before this context goes back to the pool
+                await asyncio.gather(*workers)
+                out_f.flush()  # city boundary: everything so far is on disk
 
-                if SHOW_TERMINAL_PREVIEW and printed_for_city >= TERMINAL_PREVIEW_MAX and len(urls) > TERMINAL_PREVIEW_MAX:
-                    print(f"...and {len(urls) - TERMINAL_PREVIEW_MAX} more saved to CSV for {city}.", flush=True)
+            if SHOW_TERMINAL_PREVIEW and printed_for_city >= TERMINAL_PREVIEW_MAX and found > TERMINAL_PREVIEW_MAX:
+                print(f"...and {found - TERMINAL_PREVIEW_MAX} more saved to CSV for {city}.")
 
-            finally:
-                context.close()
+        finally:
+            sys.stdout.flush()
+
+
+async def main():
+    out_path = Path(OUTPUT_CSV)
+    write_csv_header(out_path)
+
+    # One buffered handle for the whole run instead of reopening per batch
+    with out_path.open("a", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES) as out_f:
+        out_csv = csv.DictWriter(out_f, fieldnames=CSV_FIELDS, restval="", extrasaction="ignore")
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
+                headless=HEADLESS,
+                args=LAUNCH_ARGS,
+                ignore_default_args=["--enable-automation"],
+            )
+
+            # Cities share one Chromium and a fixed pool of contexts, reset per city
+            seen_urls = set()
+            async with context_pool(browser, CITY_CONCURRENCY) as contexts:
+                results = await asyncio.gather(
+                    *(process_city(contexts, city, out_f, out_csv, seen_urls) for city in CITIES),
+                    return_exceptions=True,
+                )
+            for city, res in zip(CITIES, results):
+                if isinstance(res, Exception):
+                    print(f"!! {city} failed: {res}")
 
-        browser.close()
+            await browser.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())